@@ -1,7 +1,8 @@
+import math
 import numpy as np
-from numpy import math
-from numpy import linalg as LA
 from numpy.polynomial import hermite
+from scipy.linalg import eig_banded
+from scipy.special import gammaln, logsumexp
 import utility_custom
 
 
@@ -32,15 +33,18 @@ def psi_simple_model(x_position,
     The ground state energy can be approximated as a linear superposition on-
     ly if the potential barrier is very high, f->+inf.
     """
-    psi_plus_minimum = pow((2.0 * x_potential_minimum / np.pi), 1 / 4) \
-                       * np.exp(
-        -x_potential_minimum * pow(x_position - x_potential_minimum, 2))
+    psi_norm = pow((2.0 * x_potential_minimum / np.pi), 1 / 4)
 
-    psi_minus_minimum = pow((2.0 * x_potential_minimum / np.pi), 1 / 4) \
-                        * np.exp(
-        -x_potential_minimum * pow(x_position + x_potential_minimum, 2))
+    x_plus = x_position - x_potential_minimum
+    x_minus = x_position + x_potential_minimum
 
-    psi = (psi_plus_minimum + psi_minus_minimum) * pow(2, -1 / 2)
+    psi_plus_minimum = psi_norm \
+        * np.exp(-x_potential_minimum * x_plus * x_plus)
+
+    psi_minus_minimum = psi_norm \
+        * np.exp(-x_potential_minimum * x_minus * x_minus)
+
+    psi = (psi_plus_minimum + psi_minus_minimum) / math.sqrt(2.0)
 
     return psi
 
@@ -62,26 +66,64 @@ def hermite_pol_coeff(x_position,
 
     Returns
     -------
-    hermite_coeff : double
+    hermite_coeff : ndarray
+        (x_position.size, n_array) matrix of coefficients.
 
     Notes
     ------
     Hermite polynomials coefficients are computer following the formula:
     1/(l^1/2 pi^1/4 (2^n * n!)^1/2) * exp(-x^2/l^2 /2) * H_n(x/l), where
     l is the length scale of the harmonic oscillator: l=c=(1/mw0)^1/2
+    The n-dependent prefactor is computed once, using the log-gamma
+    function to avoid the evaluation of factorials.
     """
-    hermite_coeff = np.zeros(n_array)
+    n_degree = np.arange(n_array)
 
-    for n in range(n_array):
-        val = pow(np.pi * norm * norm, -1 / 4) \
-              * pow(2.0, -n / 2) * pow(math.factorial(n), -1 / 2) \
-              * np.exp(-x_position * x_position / (2.0 * norm * norm))
+    # log(n!) = log(Gamma(n+1))
+    prefactor = pow(np.pi * norm * norm, -1 / 4) \
+        * np.exp(-0.5 * (n_degree * np.log(2.0) + gammaln(n_degree + 1)))
 
-        hermite_coeff[n] = val
+    gaussian = np.exp(-np.square(np.atleast_1d(x_position))
+                      / (2.0 * norm * norm))
+
+    hermite_coeff = gaussian[:, np.newaxis] * prefactor[np.newaxis, :]
 
     return hermite_coeff
 
 
+def euclidean_time_factors(tau_array, delta_energy):
+    """Compute the euclidean time evolution factors exp(-dE * tau).
+
+    Parameters
+    ----------
+    tau_array : ndarray
+        Uniformly spaced euclidean time array.
+
+    delta_energy : ndarray
+        Energy differences E_n - E_0.
+
+    Returns
+    -------
+    exp_factors : ndarray
+        (tau_array.size, delta_energy.size) matrix of factors.
+
+    Notes
+    ------
+    Since tau_k = tau_0 + k * dtau, exp(-dE tau_k) = exp(-dE tau_0) r^k with
+    r = exp(-dE dtau), so the rows are built by cumulative product and only
+    two exponentials per energy level are evaluated.
+    """
+    exp_factors = np.empty((tau_array.size, delta_energy.size))
+    exp_factors[0] = np.exp(-delta_energy * tau_array[0])
+
+    if tau_array.size > 1:
+        exp_factors[1:] = np.exp(-delta_energy
+                                 * (tau_array[1] - tau_array[0]))
+        np.cumprod(exp_factors, axis=0, out=exp_factors)
+
+    return exp_factors
+
+
 def corr_functs_analytic(energy_density,
                          tau_array,
                          energy_eigenvalues):
@@ -93,7 +135,7 @@ def corr_functs_analytic(energy_density,
         Energy density matrix element.
 
     tau_array : ndarray
-        Euclidean time array.
+        Uniformly spaced euclidean time array.
 
     energy_eigenvalues: ndarray
         Hamiltonian energy eigenvalues.
@@ -109,17 +151,13 @@ def corr_functs_analytic(energy_density,
     te set of eigenstates: energy_density = <0|O(tau)|n>, with O(tau) any
     time dependent operator.
     """
-    i_tau = 0
-    j_energy = 0
-    correlation_funct = np.zeros(tau_array.size)
-    for tau in tau_array:
-        for rho in energy_density:
-            correlation_funct[i_tau] += rho * \
-                                        np.exp(-(energy_eigenvalues[j_energy] -
-                                                 energy_eigenvalues[0]) * tau)
-            j_energy += 1
-        j_energy = 0
-        i_tau += 1
+    delta_energy = energy_eigenvalues[:energy_density.size] \
+        - energy_eigenvalues[0]
+
+    exp_factors = euclidean_time_factors(tau_array, delta_energy)
+
+    correlation_funct = exp_factors @ energy_density
+
     return correlation_funct
 
 
@@ -141,10 +179,8 @@ def log_corr_funct_forward_difference(corr_funct, dtau):
         Derivative of the logarithm of corr_funct.
 
     """
-    fd_der_log_corr_funct = np.zeros(corr_funct.size - 1)
-    for i in range(corr_funct.size - 1):
-        fd_der_log_corr_funct[i] = - (
-                np.log(corr_funct[i + 1]) - np.log(corr_funct[i])) / dtau
+    # log(c[i+1]) - log(c[i]) = log(c[i+1] / c[i]), one log per point
+    fd_der_log_corr_funct = - np.log(corr_funct[1:] / corr_funct[:-1]) / dtau
 
     return fd_der_log_corr_funct
 
@@ -162,7 +198,7 @@ def log_corr_funct_analytic(energy_density,
         Energy density matrix element.
 
     tau_array : ndarray
-        Euclidean time array.
+        Uniformly spaced euclidean time array.
 
     energy_eigenvalues : ndarray
         Hamiltonian energy eigenvalues.
@@ -176,19 +212,12 @@ def log_corr_funct_analytic(energy_density,
         Log-derivative of the input correlation function.
 
     """
-    i_tau = 0
-    j_energy = 0
-    an_log_corr_funct = np.zeros(tau_array.size)
-    for tau in tau_array:
-        for rho in energy_density:
-            an_log_corr_funct[i_tau] += rho \
-                                        * (energy_eigenvalues[j_energy] -
-                                           energy_eigenvalues[0]) \
-                                        * np.exp(
-                -(energy_eigenvalues[j_energy] - energy_eigenvalues[0]) * tau)
-            j_energy += 1
-        i_tau += 1
-        j_energy = 0
+    delta_energy = energy_eigenvalues[:energy_density.size] \
+        - energy_eigenvalues[0]
+
+    exp_factors = euclidean_time_factors(tau_array, delta_energy)
+
+    an_log_corr_funct = (exp_factors * delta_energy) @ energy_density
 
     an_log_corr_funct = np.divide(
         an_log_corr_funct, correlation_function)
@@ -217,17 +246,11 @@ def free_energy(energy_eigenvalues, output_path):
     """
     temperature_array = np.linspace(0.01, 2.0, 99)
 
-    free_energy_array = np.empty(temperature_array.size)
-    z_partition_function = 0.0
-    i_f_energy = 0
-    for temperature in temperature_array:
-        for energy in energy_eigenvalues:
-            z_partition_function += np.exp(-energy / temperature)
-
-        free_energy_array[i_f_energy] = temperature * np.log(
-            z_partition_function)
-        z_partition_function = 0.0
-        i_f_energy += 1
+    # log(Z) on the (temperature, energy) grid, logsumexp avoids the
+    # underflow of exp(-E/T) at low temperatures
+    free_energy_array = temperature_array * logsumexp(
+        -energy_eigenvalues[np.newaxis, :] / temperature_array[:, np.newaxis],
+        axis=1)
 
     with open(output_path + '/temperature.txt', 'w') as temperature_writer:
         np.savetxt(temperature_writer, temperature_array)
@@ -270,18 +293,19 @@ def anharmonic_oscillator_diag(n_dim,
     n_hamiltonian = n_dim + 4
 
     # position array
+    n_x_position = 401
     x_position_array = np.linspace(-2 * x_potential_minimum,
-                                   2 * x_potential_minimum)
+                                   2 * x_potential_minimum,
+                                   n_x_position,
+                                   dtype=np.float64)
     # euclidean time coordinate
     tau_max = 2.5
     n_tau = 100
     tau_array, dtau = np.linspace(0, tau_max, n_tau, retstep=True)
 
-    # hamiltonian
-    hamiltonian_matrix = np.zeros((n_hamiltonian, n_hamiltonian))
-
-    # ground state wave function
-    psi_ground_state_squared = np.zeros(x_position_array.size)
+    # hamiltonian, upper banded storage: the element <i|h|j> is stored in
+    # hamiltonian_bands[4 + i - j, j]
+    hamiltonian_bands = np.zeros((5, n_hamiltonian))
 
     # energy density
     energy_densities = np.zeros((3, n_dim))
@@ -292,62 +316,63 @@ def anharmonic_oscillator_diag(n_dim,
     # normalization coefficient for the creation and annihilation
     # operators for the harmonic oscillator
     # units of measurement: h_bar=1, m=1/2, lambda=1
-    c_norm_coeff = pow(freq_har_osc, -1 / 2)
+    c_norm_coeff = 1.0 / math.sqrt(freq_har_osc)
+    c_norm_coeff_2 = c_norm_coeff * c_norm_coeff
+    c_norm_coeff_4 = c_norm_coeff_2 * c_norm_coeff_2
 
     # anharmonic potential coeff.
     a = 1.0
-    b = -2.0 * pow(x_potential_minimum, 2) - pow(freq_har_osc, 2) / 4.0
-    c = pow(x_potential_minimum, 4)
+    x_potential_minimum_2 = x_potential_minimum * x_potential_minimum
+    b = -2.0 * x_potential_minimum_2 - freq_har_osc * freq_har_osc / 4.0
+    c = x_potential_minimum_2 * x_potential_minimum_2
 
     # Hamiltonian, symmetric n_hamiltonian x n_hamiltonian matrix
-    for i in range(n_dim):
-        # n=k-1
-        # <i|h|i>
-        hamiltonian_matrix[i, i] = \
-            a * 3 * pow(c_norm_coeff, 4) * (pow(i + 1, 2) + pow(i, 2)) \
-            + b * pow(c_norm_coeff, 2) * (2 * i + 1) \
-            + freq_har_osc * (i + 0.5) + c
-
-        # <n|h|n+2>
-        hamiltonian_matrix[i, i + 2] = \
-            a * pow(c_norm_coeff, 4) * pow((i + 1) * (i + 2), 1 / 2) * (
-                    4 * i + 6) \
-            + b * pow(c_norm_coeff, 2) * pow((i + 1) * (i + 2), 1 / 2)
-
-        hamiltonian_matrix[i + 2, i] = hamiltonian_matrix[i, i + 2]
-
-        # <n|h|n+4>
-        hamiltonian_matrix[i, i + 4] = \
-            pow(c_norm_coeff, 4) * pow(
-                (i + 1) * (i + 2) * (i + 3) * (i + 4), 1 / 2)
-
-        hamiltonian_matrix[i + 4, i] = hamiltonian_matrix[i, i + 4]
+    i_basis = np.arange(n_dim)
+    sqrt_2 = np.sqrt((i_basis + 1) * (i_basis + 2))
+    sqrt_4 = np.sqrt((i_basis + 1) * (i_basis + 2) * (i_basis + 3)
+                     * (i_basis + 4))
+
+    # <i|h|i>
+    hamiltonian_bands[4, i_basis] = \
+        a * 3 * c_norm_coeff_4 \
+        * (np.square(i_basis + 1) + np.square(i_basis)) \
+        + b * c_norm_coeff_2 * (2 * i_basis + 1) \
+        + freq_har_osc * (i_basis + 0.5) + c
+
+    # <n|h|n+2>
+    hamiltonian_bands[2, i_basis + 2] = \
+        a * c_norm_coeff_4 * sqrt_2 * (4 * i_basis + 6) \
+        + b * c_norm_coeff_2 * sqrt_2
+
+    # <n|h|n+4>
+    hamiltonian_bands[0, i_basis + 4] = c_norm_coeff_4 * sqrt_4
 
     # Diagononilzation of the Hamiltonian
-    energy_eigenvalues, energy_eigenvectors = LA.eigh(hamiltonian_matrix)
+    # The hamiltonian has only the diagonals 0, +-2 and +-4, so we use the
+    # banded symmetric eigensolver
+    energy_eigenvalues, energy_eigenvectors = eig_banded(hamiltonian_bands)
 
     # WE consider also the positive eigenvalues
     # So we neglect the first 4 eigenvectors and consider the groundstate
     # v[:,4]=> because the eigenvectors are the columns.
-    i_removal = 0
-    indices_removed = np.empty(0, int)
-    while i_removal < n_hamiltonian:
-        if energy_eigenvalues[i_removal] < 0.0:
-            indices_removed = np.append(indices_removed, i_removal)
-            i_removal += 1
-            continue
-        if energy_eigenvalues[i_removal] > 1e-5:
-            break
+    # Eigenvalues are in ascending order, the negative ones are a prefix
+    i_removal = int(np.searchsorted(energy_eigenvalues, 0.0))
+
+    # Report of the removed eigenvalues, written with a single call
+    removed_report = ['Removed energy eigenvalues:\n']
+    removed_report += [f'{value:.18e}\n'
+                       for value in energy_eigenvalues[:i_removal]]
+    for i in range(i_removal):
+        removed_report.append(f'\nEnergy eigenvector {i} components:\n')
+        removed_report += [f'{value:.18e}\n'
+                           for value in energy_eigenvectors[:, i]]
 
     with open(output_path + '/removed_energy_values.txt', 'w') as e_writer:
-        e_writer.write('Removed energy eigenvalues:\n')
-        np.savetxt(e_writer, energy_eigenvalues[:i_removal])
-        for i in range(i_removal):
-            e_writer.write(f'\nEnergy eigenvector {i} components:\n')
-            np.savetxt(e_writer, energy_eigenvectors[0:n_hamiltonian, i])
+        e_writer.write(''.join(removed_report))
 
-    energy_eigenvalues = np.delete(energy_eigenvalues, indices_removed)
-    energy_eigenvectors = np.delete(energy_eigenvectors, indices_removed, 1)
+    # Views, no copy of the eigenvector matrix
+    energy_eigenvalues = energy_eigenvalues[i_removal:]
+    energy_eigenvectors = energy_eigenvectors[:, i_removal:]
 
     # save energy eigenvalues
     with open(output_path + '/eigenvalues.txt', 'w') as e_writer:
@@ -357,77 +382,76 @@ def anharmonic_oscillator_diag(n_dim,
     # < 0|x^i|n > , i= 1,2,3.
     # We use the convention for the ladder operators:
     # a+ = (mw/2h)^1/2 (x^ +i/mw p^) and a = (mw/2h)^1/2 (x^ - i/mw p^)
-    for n in range(n_dim):
-        # C_n = | <0|x|n> |^2
-        # D_n = | <0|x^2|n> |^2
-        # E_n = | <0|x^3|n> |^2
-
-        c_n = 0.0
-        d_n = 0.0
-        e_n = 0.0
-
-        for k in range(n_dim):
-            k_minus_3 = max(k - 3, 0)
-            k_minus_2 = max(k - 2, 0)
-            k_minus_1 = max(k - 1, 0)
-            k_plus_1 = min(k + 1, n_dim - 1)
-            k_plus_2 = min(k + 2, n_dim - 1)
-            k_plus_3 = min(k + 3, n_dim - 1)
-
-            c_n += (
-                           pow(k + 1, 1 / 2) * energy_eigenvectors[k_plus_1, 0]
-                           + pow(k, 1 / 2) * energy_eigenvectors[k_minus_1, 0]
-                   ) * energy_eigenvectors[k, n]
-
-            d_n += (
-                           pow(k * (k - 1), 1 / 2) * energy_eigenvectors[
-                       k_minus_2, 0]
-                           + (2 * k + 1) * energy_eigenvectors[k, 0]
-                           + pow((k + 1) * (k + 2), 1 / 2) *
-                           energy_eigenvectors[k_plus_2, 0]
-                   ) * energy_eigenvectors[k, n]
-
-            e_n += (
-                           pow(k * (k - 1) * (k - 2), 1 / 2) *
-                           energy_eigenvectors[k_minus_3, 0]
-                           + 3 * k * pow(k, 1 / 2) * energy_eigenvectors[
-                               k_minus_1, 0]
-                           + 3 * (k + 1) * pow(k + 1, 1 / 2) *
-                           energy_eigenvectors[k_plus_1, 0]
-                           + pow((k + 1) * (k + 2) * (k + 3), 1 / 2) *
-                           energy_eigenvectors[k_plus_3, 0]
-                   ) * energy_eigenvectors[k, n]
-
-        energy_densities[0, n] = pow(c_norm_coeff, 2) * pow(c_n, 2)
-        energy_densities[1, n] = pow(c_norm_coeff, 4) * pow(d_n, 2)
-        energy_densities[2, n] = pow(c_norm_coeff, 6) * pow(e_n, 2)
+    # C_n = | <0|x|n> |^2
+    # D_n = | <0|x^2|n> |^2
+    # E_n = | <0|x^3|n> |^2
+    # The ground state components are shifted along the basis index k (and
+    # clamped at the borders), so that <0|x^i|n> is a single matvec over n.
+    k = np.arange(n_dim)
+    psi_0 = energy_eigenvectors[:n_dim, 0]
+
+    psi_0_minus_3 = psi_0[np.maximum(k - 3, 0)]
+    psi_0_minus_2 = psi_0[np.maximum(k - 2, 0)]
+    psi_0_minus_1 = psi_0[np.maximum(k - 1, 0)]
+    psi_0_plus_1 = psi_0[np.minimum(k + 1, n_dim - 1)]
+    psi_0_plus_2 = psi_0[np.minimum(k + 2, n_dim - 1)]
+    psi_0_plus_3 = psi_0[np.minimum(k + 3, n_dim - 1)]
+
+    # sqrt(j) table for j = 0, ..., n_dim + 2, the ladder operator factors
+    # sqrt(k (k-1) ...) are products of its shifted slices
+    sqrt_table = np.sqrt(np.arange(n_dim + 3))
+    sqrt_k = sqrt_table[:n_dim]
+    sqrt_k_minus_1 = sqrt_table[np.maximum(k - 1, 0)]
+    sqrt_k_minus_2 = sqrt_table[np.maximum(k - 2, 0)]
+    sqrt_k_plus_1 = sqrt_table[1:n_dim + 1]
+    sqrt_k_plus_2 = sqrt_table[2:n_dim + 2]
+    sqrt_k_plus_3 = sqrt_table[3:n_dim + 3]
+
+    c_vec = sqrt_k_plus_1 * psi_0_plus_1 + sqrt_k * psi_0_minus_1
+
+    d_vec = sqrt_k * sqrt_k_minus_1 * psi_0_minus_2 \
+        + (2 * k + 1) * psi_0 \
+        + sqrt_k_plus_1 * sqrt_k_plus_2 * psi_0_plus_2
+
+    e_vec = sqrt_k * sqrt_k_minus_1 * sqrt_k_minus_2 * psi_0_minus_3 \
+        + 3 * k * sqrt_k * psi_0_minus_1 \
+        + 3 * (k + 1) * sqrt_k_plus_1 * psi_0_plus_1 \
+        + sqrt_k_plus_1 * sqrt_k_plus_2 * sqrt_k_plus_3 * psi_0_plus_3
+
+    eigenvectors_t = energy_eigenvectors[:n_dim, :n_dim].T
+
+    energy_densities[0] = c_norm_coeff_2 * np.square(eigenvectors_t @ c_vec)
+    energy_densities[1] = c_norm_coeff_4 * np.square(eigenvectors_t @ d_vec)
+    energy_densities[2] = c_norm_coeff_4 * c_norm_coeff_2 \
+        * np.square(eigenvectors_t @ e_vec)
 
     # Groundstate wave function and its properties
 
-    for i_pos in range(x_position_array.size):
-        groundstate_projections = \
-            np.multiply(energy_eigenvectors[:, 0],
-                        hermite_pol_coeff(x_position_array[i_pos],
-                                          c_norm_coeff * pow(2.0, 1 / 2),
-                                          n_hamiltonian)
-                        )
-        psi_ground_state_squared[i_pos] = \
-            pow(hermite.hermval(
-                x_position_array[i_pos] / (c_norm_coeff * np.sqrt(2.0)),
-                groundstate_projections), 2)
+    # (n_pos, n_hamiltonian) projections, one row for each position
+    groundstate_projections = \
+        hermite_pol_coeff(x_position_array,
+                          c_norm_coeff * math.sqrt(2.0),
+                          n_hamiltonian) \
+        * energy_eigenvectors[np.newaxis, :, 0]
+
+    # Hermite polynomials H_n(x/l) for the whole basis on the position grid,
+    # (n_hamiltonian, n_pos) matrix
+    hermite_basis = hermite.hermval(
+        x_position_array / (c_norm_coeff * np.sqrt(2.0)),
+        np.eye(n_hamiltonian))
+
+    psi_ground_state_squared = \
+        np.square(np.sum(groundstate_projections * hermite_basis.T, axis=1))
 
     with open(output_path + '/x_position_array.txt', 'w') as x_writer:
         np.savetxt(x_writer, x_position_array)
     with open(output_path + '/psi_simple_model.txt', 'w') as psi_simple_writer:
-        for x_position in np.nditer(x_position_array):
-            psi_simple_writer.write(
-                str(
-                    pow(psi_simple_model(x_position, x_potential_minimum), 2)
-                )
-            )
-            psi_simple_writer.write('\n')
+        np.savetxt(psi_simple_writer,
+                   np.square(psi_simple_model(x_position_array,
+                                              x_potential_minimum)))
     with open(output_path + '/psi_ground_state.txt', 'w') as psi_ground_writer:
-        np.savetxt(psi_ground_writer, psi_ground_state_squared)
+        np.savetxt(psi_ground_writer,
+                   psi_ground_state_squared.astype(np.float32), fmt='%.8e')
 
     # Correlation functions
     corr_funct[0] = corr_functs_analytic(energy_densities[0],
@@ -442,12 +466,13 @@ def anharmonic_oscillator_diag(n_dim,
 
     with open(output_path + '/tau_array.txt', 'w') as tau_writer:
         np.savetxt(tau_writer, tau_array)
+    # Only used for plots, they are saved in single precision
     with open(output_path + '/corr_function.txt', 'w') as corr_writer:
-        np.savetxt(corr_writer, corr_funct[0])
+        np.savetxt(corr_writer, corr_funct[0].astype(np.float32), fmt='%.8e')
     with open(output_path + '/corr_function2.txt', 'w') as corr_writer:
-        np.savetxt(corr_writer, corr_funct[1])
+        np.savetxt(corr_writer, corr_funct[1].astype(np.float32), fmt='%.8e')
     with open(output_path + '/corr_function3.txt', 'w') as corr_writer:
-        np.savetxt(corr_writer, corr_funct[2])
+        np.savetxt(corr_writer, corr_funct[2].astype(np.float32), fmt='%.8e')
 
     # Logarithmic derivative of the correlators
 
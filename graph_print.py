@@ -650,8 +650,7 @@ def print_zcr_hist(i_figure):
     ax.set_xlabel(r'$\Delta\tau_{zcr}$')
     ax.set_ylabel(r'$n_{IA}(\tau_{zcr})$')
 
-    zcr = np.loadtxt('./output_data/output_rilm/zcr_hist.txt', float,
-                     delimiter=' ')
+    zcr = np.load('./output_data/output_rilm/zcr_hist.npy')
 
     zcr_cooling = np.loadtxt(
         './output_data/output_cooled_monte_carlo/zero_crossing/zcr_cooling.txt',
@@ -868,12 +867,10 @@ def print_iilm(i_figure):
     ax.set_xlabel(r'$\Delta\tau_{IA}$')
     ax.set_ylabel(r'$S_{int}\slash S_{0}$')
 
-    tau_ia = np.loadtxt(
-        './output_data/output_iilm/streamline/delta_tau_ia.txt',
-        float, delimiter=' ')
+    tau_ia = np.load(
+        './output_data/output_iilm/streamline/delta_tau_ia.npy')
 
-    zcr = np.loadtxt('./output_data/output_rilm/zcr_hist.txt', float,
-                     delimiter=' ')
+    zcr = np.load('./output_data/output_rilm/zcr_hist.npy')
     zcr_cooling = np.loadtxt(
         './output_data/output_cooled_monte_carlo/zero_crossing/zcr_cooling.txt',
         float, delimiter=' ')
@@ -886,9 +883,8 @@ def print_iilm(i_figure):
     action_ia = -np.log(hist_2[0:10] / hist_1[0:10]) / (
         4 / 3 * np.power(1.4, 3))
 
-    act_int = np.loadtxt(
-        './output_data/output_iilm/streamline/streamline_action_int.txt',
-        float, delimiter=' ')
+    act_int = np.load(
+        './output_data/output_iilm/streamline/streamline_action_int.npy')
 
     tau_ia_ansatz = np.loadtxt('./output_data/output_iilm/streamline/tau_ia_ansatz.txt',
                           float, delimiter=' ')
@@ -17,7 +17,8 @@ def inst_int_liquid_model(n_lattice,
                           n_conf = 3000,
                           n_ia = 0,
                           x_potential_minimum=1.4,
-                          dtau=0.05):
+                          dtau=0.05,
+                          verbose=False):
     """Compute correlation functions for the anharmonic oscillator
     using an interactin ensemble of instantons.
 
@@ -46,6 +47,8 @@ def inst_int_liquid_model(n_lattice,
         Position of the minimum(a) of the anharmonic potential.
     dtau : float, default=0.05
         Lattice spacing.
+    verbose : bool, default=False
+        Print the progress of the simulation.
 
     Returns
     ----------
@@ -59,7 +62,8 @@ def inst_int_liquid_model(n_lattice,
     tau_array = np.linspace(0.0, n_lattice * dtau, n_lattice, False)
 
     # Classical action value
-    action_0 = 4 / 3 * np.power(x_potential_minimum, 3)
+    action_0 = 4 / 3 * x_potential_minimum * x_potential_minimum \
+        * x_potential_minimum
 
     if n_ia == 0:
         # n_ia evaluated from 2-loop semi-classical expansion
@@ -67,7 +71,7 @@ def inst_int_liquid_model(n_lattice,
                            * n_lattice * dtau))
 
     # Center of instantons and anti instantons
-    tau_centers_ia = rilm.centers_setup(n_ia, tau_array.size)
+    tau_centers_ia = rilm.centers_setup(n_ia, tau_array.size, dtau)
 
     # Correlation functions
     x_cor_sums = np.zeros((3, n_points))
@@ -82,9 +86,6 @@ def inst_int_liquid_model(n_lattice,
     start = time.time()
 
     for i_mc in range(n_mc_sweeps):
-        # Store tau centers between iterations
-        tau_centers_ia_store = np.copy(tau_centers_ia)
-
         # Initialize the lattice
         x_config = rilm.ansatz_instanton_conf(tau_centers_ia,
                                               tau_array,
@@ -101,11 +102,13 @@ def inst_int_liquid_model(n_lattice,
                                             action_0,
                                             dtau)
 
-        if i_mc % 10000 == 0:
+        if verbose and (i_mc & 1023) == 0:
             print(f'#{i_mc} sweep in {n_mc_sweeps - 1}')
             
         # Evolve one center at a time
         for i in range(tau_centers_ia.size):
+            # Store the center in case the update is rejected
+            tau_center_store = tau_centers_ia[i]
             tau_centers_ia[i] += \
                 (np.random.uniform(0.0, 1.0) - 0.5) * dx_update
 
@@ -133,7 +136,7 @@ def inst_int_liquid_model(n_lattice,
             if np.exp(-delta_action) > np.random.uniform(0., 1.):
                 action_old = action_new
             else:
-                tau_centers_ia[i] = tau_centers_ia_store[i]
+                tau_centers_ia[i] = tau_center_store
 
         if (i_mc + 1) < n_conf:
             tau_centers_evolution[i_mc + 1] = tau_centers_ia
@@ -20,7 +20,8 @@ def cooled_monte_carlo(
         n_cooling_sweeps,
         x_potential_minimum=1.4,
         dtau=0.05,
-        delta_x=0.5):
+        delta_x=0.5,
+        verbose=False):
     """Compute spatial correlation functions for the anharmonic oscil-
     lator using Monte Carlo simulations for cooled configurations.
 
@@ -57,6 +58,8 @@ def cooled_monte_carlo(
         Lattice spacing.
     delta_x : float, default=0.5
         Width of Gaussian distribution for Metropolis update.
+    verbose : bool, default=False
+        Print the progress of the simulation.
 
     Returns
     -------
@@ -79,25 +82,28 @@ def cooled_monte_carlo(
     x2_cold_cor_sums = np.zeros((3, n_points))
 
     # x position along the tau axis
-    x_config = mc.initialize_lattice(n_lattice, i_cold)
+    x_config = mc.initialize_lattice(n_lattice,
+                                     x_potential_minimum,
+                                     i_cold)
+    x_cold_config = np.empty_like(x_config)
 
     # Monte Carlo sweeps: Principal cycle
 
     # Equilibration cycle
     for i_equil in range(n_equil):
-        mc.metropolis_question(x_config,
+        mc.metropolis_sweep_rb(x_config,
                                x_potential_minimum,
                                dtau,
                                delta_x)
 
     # Rest of the MC sweeps
     for i_mc in range(n_mc_sweeps - n_equil):
-        mc.metropolis_question(x_config,
+        mc.metropolis_sweep_rb(x_config,
                                x_potential_minimum,
                                dtau,
                                delta_x)
 
-        if i_mc % int((n_mc_sweeps - n_equil)/10) == 0:
+        if verbose and (i_mc & 1023) == 0:
             print(f'conf: {i_mc}\n'
                   +f'Action: {mc.return_action(x_config, x_potential_minimum, dtau)}')
 
@@ -114,7 +120,7 @@ def cooled_monte_carlo(
             # expected number of cooled configuration = n_conf/n_sweeps_btw_cooling
             # print    f'in configuration #{i_mc}')
 
-            x_cold_config = np.copy(x_config)
+            np.copyto(x_cold_config, x_config)
             n_cooling += 1
 
             for i_cooling in range(n_cooling_sweeps):
@@ -80,7 +80,8 @@ def instantons_density_switching(n_lattice,
         density_error = np.empty(2)
         gauss_density = 8 * np.power(x_potential_minimum, 5 / 2) \
                         * np.sqrt(2 / np.pi) \
-                        * np.exp(-4 * np.power(x_potential_minimum, 3) / 3)
+                        * np.exp(-4 * x_potential_minimum * x_potential_minimum
+                                 * x_potential_minimum / 3)
 
         # Variables for switching algorithm
         d_alpha = 1.0 / n_switching
@@ -258,8 +259,10 @@ def instantons_density_switching(n_lattice,
         # Total density and error
         total_density[i_minimum] = gauss_density * density[1] / density[0]
         total_density_error[i_minimum] = total_density[i_minimum] * \
-                                         np.sqrt(pow(density_error[0], 2)
-                                                 + pow(density_error[1], 2))
+                                         np.sqrt(density_error[0]
+                                                 * density_error[0]
+                                                 + density_error[1]
+                                                 * density_error[1])
 
         print(f'density {total_density[i_minimum]} '
               f'+/- {total_density_error[i_minimum]}')
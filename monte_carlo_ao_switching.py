@@ -112,7 +112,8 @@ def monte_carlo_ao_switching(n_lattice,
             delta_s_alpha_temp = np.sum(potential_diff) * dtau
 
             delta_s_alpha[i_switching] += delta_s_alpha_temp
-            delta_s_alpha2[i_switching] += np.power(delta_s_alpha_temp, 2)
+            delta_s_alpha2[i_switching] += delta_s_alpha_temp \
+                * delta_s_alpha_temp
 
         # Monte Carlo End
         # Control Acceptance ratio
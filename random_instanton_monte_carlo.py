@@ -54,44 +54,31 @@ def random_instanton_liquid_model(n_lattice,
     # Euclidean time
     tau_array = np.linspace(0.0, n_lattice * dtau, n_lattice, False)
 
-    # Correlation functions
-    x_cor_sums = np.zeros((3, n_points))
-    x2_cor_sums = np.zeros((3, n_points))
+    # Correlation functions, in a single buffer whose rows are padded to
+    # a multiple of 8 elements
+    cor_sums = np.zeros((6, (n_points + 7) & ~7))
+    x_cor_sums = cor_sums[:3, :n_points]
+    x2_cor_sums = cor_sums[3:, :n_points]
 
     if n_ia == 0:
         # n_ia evaluated from 2-loop semi-classical expansion
         n_ia = int(np.rint(two_loop_density(x_potential_minimum)
                            * n_lattice * dtau))
     
-    hist_writer = open(output_path +'/zcr_hist.txt','w')
+    # Monte Carlo simulation, with the instanton/anti-instanton zero
+    # crossing distribution: distance of each instanton from the nearest
+    # anti-instanton
+    z_ia = rilm.rilm_monte_carlo_sweeps(n_ia,
+                                        n_mc_sweeps,
+                                        n_points,
+                                        n_meas,
+                                        tau_array,
+                                        x_cor_sums,
+                                        x2_cor_sums,
+                                        x_potential_minimum,
+                                        dtau)
 
-    # Monte Carlo simulation
-    for i_mc in range(n_mc_sweeps):
-        if i_mc % 100 == 0:
-            print(f'#{i_mc} sweep in {n_mc_sweeps - 1}')
-            
-        tau_centers_ia = rilm.rilm_monte_carlo_step(n_ia,
-                                   n_points,
-                                   n_meas,
-                                   tau_array,
-                                   x_cor_sums,
-                                   x2_cor_sums,
-                                   x_potential_minimum,
-                                   dtau)
-
-        # construct the i/a zero crossing distribution
-        for i in range(0, n_ia, 2):
-            if i == 0:
-                zero_m = tau_centers_ia[-1] - n_lattice * dtau
-            else:
-                zero_m = tau_centers_ia[i-1]
-                
-            z_ia = min((tau_centers_ia[i+1]-tau_centers_ia[i]),
-                       (tau_centers_ia[i] - zero_m))
-
-            hist_writer.write(str(z_ia) + '\n')
-
-    hist_writer.close()
+    np.save(output_path + '/zcr_hist.npy', z_ia)
 
     # compute correlation functions
     utility_custom.\
@@ -63,9 +63,11 @@ def random_instanton_liquid_model_heating(n_lattice,  # size of the grid
     # Eucliadian time
     tau_array = np.linspace(0.0, n_lattice * dtau, n_lattice, False)
 
-    # Correlation functions
-    x_cor_sums = np.zeros((3, n_points))
-    x2_cor_sums = np.zeros((3, n_points))
+    # Correlation functions, in a single buffer whose rows are padded to
+    # a multiple of 8 elements
+    cor_sums = np.zeros((6, (n_points + 7) & ~7))
+    x_cor_sums = cor_sums[:3, :n_points]
+    x2_cor_sums = cor_sums[3:, :n_points]
 
     start = time.time()
 
@@ -74,40 +76,26 @@ def random_instanton_liquid_model_heating(n_lattice,  # size of the grid
         n_ia = int(np.rint(two_loop_density(x_potential_minimum)
                            * n_lattice * dtau))
 
-    for i_mc in range(n_mc_sweeps):
-        if i_mc % 10000 == 0:
-            print(f'#{i_mc} sweep in {n_mc_sweeps - 1}')
-
-        # print last config
-        if i_mc % int(n_mc_sweeps-1) == 0:
-            x_ansatz , x_ansatz_heated = rilm.rilm_heated_monte_carlo_step(n_ia,
-                                          n_heating,
-                                          n_points,
-                                          n_meas,
-                                          tau_array,
-                                          x_cor_sums,
-                                          x2_cor_sums,
-                                          x_potential_minimum,
-                                          dtau,
-                                          delta_x)
-            with open(output_path + '/x1_config.txt',
-                      'w') as f_w:
-                np.savetxt(f_w, x_ansatz)
-            with open(output_path + '/x2_config.txt',
-                      'w') as f_w:
-                np.savetxt(f_w, x_ansatz_heated)
-        else:
-            _, _ = rilm.rilm_heated_monte_carlo_step(n_ia,
-                                          n_heating,
-                                          n_points,
-                                          n_meas,
-                                          tau_array,
-                                          x_cor_sums,
-                                          x2_cor_sums,
-                                          x_potential_minimum,
-                                          dtau,
-                                          delta_x)
-
+    x_ansatz, x_ansatz_heated = rilm.rilm_heated_monte_carlo_sweeps(
+        n_ia,
+        n_mc_sweeps,
+        n_heating,
+        n_points,
+        n_meas,
+        tau_array,
+        x_cor_sums,
+        x2_cor_sums,
+        x_potential_minimum,
+        dtau,
+        delta_x)
+
+    # print last config
+    with open(output_path + '/x1_config.txt',
+              'w') as f_w:
+        np.savetxt(f_w, x_ansatz)
+    with open(output_path + '/x2_config.txt',
+              'w') as f_w:
+        np.savetxt(f_w, x_ansatz_heated)
 
     utility_custom. \
         output_correlation_functions_and_log(n_points,
@@ -89,10 +89,12 @@ def log_central_der_alg(corr_funct, corr_funct_err, delta_step):
                 corr_funct[i_array + 1] - corr_funct[i_array]) \
                                   / (corr_funct[i_array] * delta_step)
 
-        derivative_log_err[i_array] = np.power(
-            np.power(corr_funct_err[i_array + 1] / corr_funct[i_array], 2)
-            + np.power(corr_funct_err[i_array] * corr_funct[i_array + 1]
-                  / np.power(corr_funct[i_array], 2), 2), 1 / 2) / delta_step
+        err_1 = corr_funct_err[i_array + 1] / corr_funct[i_array]
+        err_2 = corr_funct_err[i_array] * corr_funct[i_array + 1] \
+            / (corr_funct[i_array] * corr_funct[i_array])
+
+        derivative_log_err[i_array] = np.sqrt(err_1 * err_1 + err_2 * err_2) \
+            / delta_step
 
     return derivative_log, derivative_log_err
 
@@ -128,14 +130,16 @@ def correlation_measurments(n_lattice, n_meas, n_points,
         for i_point in range(n_points):
             x_1 = x_config[i_p0 + i_point]
             x_01 = x_0 * x_1
+            x_01_2 = x_01 * x_01
+            x_01_3 = x_01_2 * x_01
 
             x_cor_sums[0, i_point] += x_01
-            x_cor_sums[1, i_point] += np.power(x_01, 2)
-            x_cor_sums[2, i_point] += np.power(x_01, 3)
+            x_cor_sums[1, i_point] += x_01_2
+            x_cor_sums[2, i_point] += x_01_3
 
-            x2_cor_sums[0, i_point] += np.power(x_01, 2)
-            x2_cor_sums[1, i_point] += np.power(x_01, 4)
-            x2_cor_sums[2, i_point] += np.power(x_01, 6)
+            x2_cor_sums[0, i_point] += x_01_2
+            x2_cor_sums[1, i_point] += x_01_2 * x_01_2
+            x2_cor_sums[2, i_point] += x_01_3 * x_01_3
 
 
 # OUTPUT-----------------------------------------------------------------------
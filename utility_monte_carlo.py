@@ -1,5 +1,5 @@
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 
 @njit
@@ -308,6 +308,117 @@ def metropolis_question(x_config,
     periodic_boundary_conditions(x_config)
 
 
+@njit
+def metropolis_site_update(x_config,
+                           i,
+                           x_potential_minimum,
+                           dtau,
+                           delta_x):
+    """Metropolis update of a single lattice site.
+
+    Parameters
+    ----------
+    x_config : ndarray
+        System (spatial) configuration.
+    i : int
+        Index of the updated site.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+    delta_x : float
+        Width of Gaussian distribution for Metropolis update.
+
+    Returns
+    ----------
+    None
+    """
+    action_loc_old = (np.square(x_config[i] - x_config[i - 1])
+                      + np.square(x_config[i + 1] - x_config[i])) / (
+                             4. * dtau) \
+                     + dtau * potential_anh_oscillator(x_config[i],
+                                                       x_potential_minimum)
+
+    x_new = x_config[i] + delta_x * \
+            (2 * np.random.uniform(0.0, 1.0) - 1.)
+
+    action_loc_new = (np.square(x_new - x_config[i - 1])
+                      + np.square(x_config[i + 1] - x_new)) / (4. * dtau) \
+                     + dtau * potential_anh_oscillator(x_new,
+                                                       x_potential_minimum)
+
+    delta_action_exp = np.exp(action_loc_old - action_loc_new)
+
+    if delta_action_exp > np.random.uniform(0., 1.):
+        x_config[i] = x_new
+
+
+@njit(parallel=True)
+def metropolis_sweep_rb(x_config,
+                        x_potential_minimum,
+                        dtau,
+                        delta_x):
+    """Metropolis sweep with a red-black (checkerboard) ordering of the
+    lattice sites.
+
+    Sites of the same color do not interact, so they are updated in
+    parallel. The odd sites are updated first, then the even ones. At the
+    end periodic boundary conditions are imposed.
+
+    Parameters
+    ----------
+    x_config : ndarray
+        System (spatial) configuration.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+    delta_x : float
+        Width of Gaussian distribution for Metropolis update.
+
+    Returns
+    ----------
+    None
+
+    Notes
+    ----------
+    If the number of sites is odd, the first and the last site are neigh-
+    bours on the periodic lattice, so the last one is updated alone. Each
+    thread draws from its own random number generator state.
+    """
+    n_sites = x_config.size - 2
+    n_half = n_sites // 2
+
+    # Red sites
+    for j in prange(n_half):
+        metropolis_site_update(x_config,
+                               2 * j + 1,
+                               x_potential_minimum,
+                               dtau,
+                               delta_x)
+
+    periodic_boundary_conditions(x_config)
+
+    # Black sites
+    for j in prange(n_half):
+        metropolis_site_update(x_config,
+                               2 * j + 2,
+                               x_potential_minimum,
+                               dtau,
+                               delta_x)
+
+    periodic_boundary_conditions(x_config)
+
+    if n_sites % 2 == 1:
+        metropolis_site_update(x_config,
+                               n_sites,
+                               x_potential_minimum,
+                               dtau,
+                               delta_x)
+
+        periodic_boundary_conditions(x_config)
+
+
 @njit
 def metropolis_question_switching(x_config,
                                   x_potential_minimum,
@@ -429,6 +540,121 @@ def configuration_cooling(x_cold_config,
     periodic_boundary_conditions(x_cold_config)
 
 
+@njit(parallel=True)
+def cooled_density_sweeps(n_lattice,
+                          n_equil,
+                          n_mc_sweeps,
+                          i_cold,
+                          n_sweeps_btw_cooling,
+                          n_cooling_sweeps,
+                          potential_minima,
+                          dtau,
+                          delta_x,
+                          n_total_instantons_sum,
+                          n2_total_instantons_sum,
+                          action_cooling,
+                          action2_cooling):
+    """Run the Monte Carlo simulations with cooling for an array of poten-
+    tial minima, accumulating the total number of instantons and anti-in-
+    stantons and the action as function of the number of cooling sweeps.
+
+    Parameters
+    ----------
+    n_lattice : int
+        Number of lattice point in euclidean time.
+    n_equil : int
+        Number of equilibration Monte Carlo sweeps.
+    n_mc_sweeps : int
+        Number of Monte Carlo sweeps.
+    i_cold : bool
+        True for cold start, False for hot start.
+    n_sweeps_btw_cooling : int
+        Number of MC sweeps between two consecutive coolings.
+    n_cooling_sweeps : int
+        Number of MC sweeps for each cooling.
+    potential_minima : ndarray
+        Positions of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+    delta_x : float
+        Width of Gaussian distribution for Metropolis update.
+    n_total_instantons_sum : ndarray
+        (potential_minima.size, n_cooling_sweeps) number of instantons.
+    n2_total_instantons_sum : ndarray
+        Number of instantons squared.
+    action_cooling : ndarray
+        (potential_minima.size, n_cooling_sweeps) action.
+    action2_cooling : ndarray
+        Action squared.
+
+    Returns
+    ----------
+    n_cooling : ndarray
+        Number of cooling processes for each potential minimum.
+
+    Notes
+    ----------
+    The Markov chains for different potential minima are independent, and
+    they are run in parallel. Every row of the output arrays is written by
+    a single chain.
+    """
+    n_cooling = np.zeros(potential_minima.size, np.int64)
+
+    for i_minimum in prange(potential_minima.size):
+        x_potential_minimum = potential_minima[i_minimum]
+
+        # x position along the tau axis
+        x_config = initialize_lattice(n_lattice,
+                                      x_potential_minimum,
+                                      i_cold)
+        x_cold_config = np.empty_like(x_config)
+
+        # Equilibration sweeps
+        for _ in range(n_equil):
+            metropolis_question(x_config,
+                                x_potential_minimum,
+                                dtau,
+                                delta_x)
+
+        # Rest of the MC sweeps
+        for i_mc in range(n_mc_sweeps - n_equil):
+            metropolis_question(x_config,
+                                x_potential_minimum,
+                                dtau,
+                                delta_x)
+
+            # COOLING
+            if (i_mc % n_sweeps_btw_cooling) == 0:
+
+                n_cooling[i_minimum] += 1
+                x_cold_config[:] = x_config
+
+                for i_cooling in range(n_cooling_sweeps):
+                    configuration_cooling(x_cold_config,
+                                          x_potential_minimum,
+                                          dtau,
+                                          delta_x)
+
+                    n_instantons, n_anti_instantons, _, _ = \
+                        find_instantons(x_cold_config,
+                                        dtau)
+
+                    n_total = n_instantons + n_anti_instantons
+                    n_total_instantons_sum[i_minimum, i_cooling] += n_total
+                    n2_total_instantons_sum[i_minimum, i_cooling] += \
+                        n_total * n_total
+
+                    action_temp = return_action(x_cold_config,
+                                                x_potential_minimum,
+                                                dtau)
+
+                    action_cooling[i_minimum, i_cooling] += action_temp
+                    action2_cooling[i_minimum, i_cooling] += \
+                        action_temp * action_temp
+
+    return n_cooling
+
+
 @njit
 def return_action(x_config,
                   x_potential_minimum,
@@ -438,25 +664,27 @@ def return_action(x_config,
     Parameters
     ----------
     x_config : ndarray
-        Spatial configuration.
+        Spatial configuration. If it is a matrix, each row is a configu-
+        ration.
     x_potential_minimum : float
         Position of the minimum(a) of the anharmonic potential.
     dtau : float
         Lattice spacing.
     Returns
     -------
-    float
-        Action.
+    float or ndarray
+        Action, for each row of x_config if it is a matrix.
 
     Notes
     -------
     We use a system of unit of measurements where h_bar=1.
     """
-    action = np.square(x_config[1:-1] - x_config[0:-2]) / (4. * dtau) \
-             + dtau * potential_anh_oscillator(x_config[1:-1],
-                                               x_potential_minimum)
+    action = np.square(x_config[..., 1:-1] - x_config[..., 0:-2]) \
+        / (4. * dtau) \
+        + dtau * potential_anh_oscillator(x_config[..., 1:-1],
+                                          x_potential_minimum)
 
-    return np.sum(action)
+    return action.sum(axis=-1)
 
 
 @njit
@@ -503,7 +731,7 @@ def initialize_lattice(n_lattice,
 
         return x_config
 
-    elif classical_config is True:
+    else:
         tau_inst = (dtau * n_lattice) / 2
         tau_array = np.linspace(0, n_lattice * dtau, n_lattice + 1)
         x_config = instanton_classical_configuration(tau_array,
@@ -697,7 +925,7 @@ def two_loop_density(x_pot_min):
     float
         Density.
     """
-    action_0 = np.power(x_pot_min, 3) * 4 / 3
+    action_0 = x_pot_min * x_pot_min * x_pot_min * 4 / 3
 
     return 8 * np.power(x_pot_min, 5 / 2) * np.power(2 / np.pi, 1 / 2) \
            * np.exp(-action_0 - 71 / (72 * action_0))
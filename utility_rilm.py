@@ -77,8 +77,6 @@ def ansatz_instanton_conf(tau_centers_ia,
         Euclidean time axis.
     x_potential_minimum : float
         Position of the minimum(a) of the anharmonic potential.
-    dtau : float
-        Lattice spacing.
 
     Returns
     -------
@@ -104,6 +102,46 @@ def ansatz_instanton_conf(tau_centers_ia,
     return x_ansatz
 
 
+@njit
+def ansatz_instanton_conf_batch(tau_centers_ia,
+                                tau_array,
+                                x_potential_minimum):
+    """Generate a batch of paths according to the sum ansatz.
+
+    Parameters
+    ----------
+    tau_centers_ia : ndarray
+        (n_conf, n_ia) matrix of instantons/anti-instantons ensembles, a
+        path is generated for each row.
+    tau_array : ndarray
+        Euclidean time axis.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+
+    Returns
+    -------
+    x_ansatz : ndarray
+        (n_conf, tau_array.size + 1) matrix of configuration paths.
+    """
+    x_ansatz = np.zeros((tau_centers_ia.shape[0], tau_array.size + 1))
+
+    top_charge = 1
+    for i_ia in range(tau_centers_ia.shape[1]):
+        x_ansatz[:, :-1] += top_charge * x_potential_minimum \
+            * np.tanh(2 * x_potential_minimum
+                      * (tau_array - tau_centers_ia[:, i_ia:i_ia + 1]))
+
+        top_charge *= -1
+
+    x_ansatz -= x_potential_minimum
+
+    # Border periodic conditions
+    x_ansatz[:, 0] = x_ansatz[:, -2]
+    x_ansatz[:, -1] = x_ansatz[:, 1]
+
+    return x_ansatz
+
+
 @njit
 def gaussian_potential(x_position):
     """Compute the gaussian potential for an ensemble of instantons/anti-
@@ -265,7 +303,8 @@ def rilm_monte_carlo_step(n_ia,  # number of instantons and anti inst.
                           tau_array,
                           x_cor_sums,
                           x2_cor_sums,
-                          x_potential_minimum
+                          x_potential_minimum,
+                          dtau
                           ):
     """Compute correlation functions using the sum ansatz path and generate
     a random distribution of instantons/anti-instantons.
@@ -296,7 +335,7 @@ def rilm_monte_carlo_step(n_ia,  # number of instantons and anti inst.
     """
 
     # Center of instantons and anti instantons
-    tau_centers_ia = centers_setup(n_ia, tau_array.size)
+    tau_centers_ia = centers_setup(n_ia, tau_array.size, dtau)
 
     # Ansatz sum of indipendent instantons
     x_ansatz = ansatz_instanton_conf(tau_centers_ia,
@@ -313,6 +352,76 @@ def rilm_monte_carlo_step(n_ia,  # number of instantons and anti inst.
     return tau_centers_ia
 
 
+@njit
+def rilm_monte_carlo_sweeps(n_ia,
+                            n_mc_sweeps,
+                            n_points,
+                            n_meas,
+                            tau_array,
+                            x_cor_sums,
+                            x2_cor_sums,
+                            x_potential_minimum,
+                            dtau):
+    """Run the random instanton Monte Carlo sweeps and collect the
+    instanton/anti-instanton zero crossing distribution.
+
+    Parameters
+    ----------
+    n_ia : int
+        Number of instantons/anti-instantons. It has to be even.
+    n_mc_sweeps : int
+        Number of Monte Carlo sweeps.
+    n_points : int
+        Number of points on which correlation functions are computed.
+    n_meas : int
+        Number of measurement of correlation functions in a MC sweep.
+    tau_array : ndarray
+        Euclidean time axis.
+    x_cor_sums : ndarray
+        Path spatial positions to be averaged.
+    x2_cor_sums : ndarray
+        Position squared to be averaged.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+
+    Returns
+    -------
+    z_ia : ndarray
+        Distance of each instanton from the nearest anti-instanton, for
+        every sweep.
+    """
+    n_half = n_ia // 2
+    tau_max = tau_array.size * dtau
+
+    z_ia = np.empty(n_mc_sweeps * n_half)
+
+    for i_mc in range(n_mc_sweeps):
+        tau_centers_ia = rilm_monte_carlo_step(n_ia,
+                                               n_points,
+                                               n_meas,
+                                               tau_array,
+                                               x_cor_sums,
+                                               x2_cor_sums,
+                                               x_potential_minimum,
+                                               dtau)
+
+        # Zero crossing distribution
+        z_sweep = z_ia[i_mc * n_half:(i_mc + 1) * n_half]
+        for i_z in range(n_half):
+            if i_z == 0:
+                zero_m = tau_centers_ia[-1] - tau_max
+            else:
+                zero_m = tau_centers_ia[2 * i_z - 1]
+
+            z_sweep[i_z] = min(
+                tau_centers_ia[2 * i_z + 1] - tau_centers_ia[2 * i_z],
+                tau_centers_ia[2 * i_z] - zero_m)
+
+    return z_ia
+
+
 @njit
 def rilm_heated_monte_carlo_step(n_ia,  # number of instantons and anti inst.
                                  n_heating,
@@ -393,4 +502,73 @@ def rilm_heated_monte_carlo_step(n_ia,  # number of instantons and anti inst.
                                            x_ansatz_hot,
                                            x_cor_sums,
                                            x2_cor_sums)
-    return x_ansatz, x_ansatz_hot
\ No newline at end of file
+    return x_ansatz, x_ansatz_hot
+
+
+@njit
+def rilm_heated_monte_carlo_sweeps(n_ia,
+                                   n_mc_sweeps,
+                                   n_heating,
+                                   n_points,
+                                   n_meas,
+                                   tau_array,
+                                   x_cor_sums,
+                                   x2_cor_sums,
+                                   x_potential_minimum,
+                                   dtau,
+                                   delta_x):
+    """Run the random instanton Monte Carlo sweeps using the heating
+    method.
+
+    Parameters
+    ----------
+    n_ia : int
+        Number of instantons/anti-instantons.
+    n_mc_sweeps : int
+        Number of Monte Carlo sweeps.
+    n_heating : int
+        Number of heating sweeps.
+    n_points : int
+        Number of points on which correlation functions are computed.
+    n_meas : int
+        Number of measurement of correlation functions in a MC sweep.
+    tau_array : ndarray
+        Euclidean time axis.
+    x_cor_sums : ndarray
+        Spatial configuration.
+    x2_cor_sums : ndarray
+        Spatial configuration squared.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+    delta_x : float
+        Width of Gaussian distribution for Metropolis update.
+
+    Returns
+    ----------
+    x_ansatz : ndarray
+        Last sum ansatz configuration.
+    x_ansatz_hot : ndarray
+        Last sum ansatz configuration with gaussian fluctuations.
+    """
+    if n_mc_sweeps < 1:
+        raise ValueError('n_mc_sweeps must be at least 1')
+
+    x_ansatz = np.empty(tau_array.size + 1)
+    x_ansatz_hot = np.empty(tau_array.size + 1)
+
+    for _ in range(n_mc_sweeps):
+        x_ansatz, x_ansatz_hot = rilm_heated_monte_carlo_step(
+            n_ia,
+            n_heating,
+            n_points,
+            n_meas,
+            tau_array,
+            x_cor_sums,
+            x2_cor_sums,
+            x_potential_minimum,
+            dtau,
+            delta_x)
+
+    return x_ansatz, x_ansatz_hot
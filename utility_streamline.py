@@ -0,0 +1,90 @@
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def streamline_step(x_config,
+                    lambda_derivative,
+                    x_potential_minimum,
+                    dtau,
+                    stream_time_step):
+    """Evolve an instanton/anti-instanton configuration by one step of the
+    descent method along the streamline.
+
+    Parameters
+    ----------
+    x_config : ndarray
+        Spatial configuration, with two ghost points at each border.
+    lambda_derivative : ndarray
+        Derivative of the action with respect to the streamline parameter.
+        It is overwritten.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+    stream_time_step : float
+        Streamline time step.
+
+    Returns
+    ----------
+    None
+
+    Notes
+    ----------
+    The second derivative is computed with the 5-point stencil, and the
+    ghost points are fixed to the border values after the update.
+    We use a system of unit of measurements where h_bar=1, m=1/2 and
+    lambda=1.
+    """
+    # Loop invariants
+    x_min_2 = x_potential_minimum * x_potential_minimum
+    inv_24_dtau_2 = 1. / (24 * dtau * dtau)
+
+    n_points = lambda_derivative.size
+
+    # Every derivative is evaluated on the old configuration
+    for i in range(2, n_points + 2):
+        xc = x_config[i]
+        lambda_derivative[i - 2] = \
+            - (-x_config[i + 2] + 16 * x_config[i + 1] - 30 * xc
+               + 16 * x_config[i - 1] - x_config[i - 2]) * inv_24_dtau_2 \
+            + 4 * xc * (xc * xc - x_min_2)
+
+    for i in range(2, n_points + 2):
+        x_config[i] -= lambda_derivative[i - 2] * stream_time_step
+
+    x_config[0] = x_config[2]
+    x_config[1] = x_config[2]
+    x_config[-1] = x_config[-3]
+    x_config[-2] = x_config[-3]
+
+
+@njit(cache=True, fastmath=True)
+def streamline_action_density(x_config,
+                              action_density,
+                              x_potential_minimum,
+                              dtau):
+    """Compute the action density of a streamline configuration.
+
+    Parameters
+    ----------
+    x_config : ndarray
+        Spatial configuration, with two ghost points at each border.
+    action_density : ndarray
+        Action density. It is overwritten.
+    x_potential_minimum : float
+        Position of the minimum(a) of the anharmonic potential.
+    dtau : float
+        Lattice spacing.
+
+    Returns
+    ----------
+    None
+    """
+    x_min_2 = x_potential_minimum * x_potential_minimum
+    inv_2_dtau = 1. / (2. * dtau)
+
+    for i in range(2, action_density.size + 2):
+        v = x_config[i] * x_config[i] - x_min_2
+        v *= v
+        k = (x_config[i + 1] - x_config[i - 1]) * inv_2_dtau
+        action_density[i - 2] = k * k / 4. + v
@@ -13,7 +13,8 @@ def zero_crossing_cooling_density(n_lattice,
                                   n_data,
                                   x_potential_minimum=1.4,
                                   dtau=0.05,
-                                  delta_x=0.5):
+                                  delta_x=0.5,
+                                  verbose=False):
     """Determine the zero crossing histogram for cooled configurations
     of instantons and anti-instantons.
 
@@ -39,6 +40,8 @@ def zero_crossing_cooling_density(n_lattice,
         Lattice spacing.
     delta_x : float, default=0.5
         Width of Gaussian distribution for Metropolis update.
+    verbose : bool, default=False
+        Print the progress of the simulation.
 
     Returns
     -------
@@ -63,7 +66,10 @@ def zero_crossing_cooling_density(n_lattice,
     n_cooling = 0
 
     # x position along the tau axis
-    x_config = mc.initialize_lattice(n_lattice, i_cold)
+    x_config = mc.initialize_lattice(n_lattice,
+                                     x_potential_minimum,
+                                     i_cold)
+    x_cold_config = np.empty_like(x_config)
     count = 0
     # zero crossing density fistribution
     hist_writer = open(output_path + '/zcr_cooling.txt', 'w')
@@ -75,7 +81,7 @@ def zero_crossing_cooling_density(n_lattice,
 
     # Equilibration cycle
     for _ in range(n_equil):
-        mc.metropolis_question(x_config,
+        mc.metropolis_sweep_rb(x_config,
                                x_potential_minimum,
                                dtau,
                                delta_x)
@@ -87,7 +93,7 @@ def zero_crossing_cooling_density(n_lattice,
         if count > n_data:
             break
 
-        mc.metropolis_question(x_config,
+        mc.metropolis_sweep_rb(x_config,
                                x_potential_minimum,
                                dtau,
                                delta_x)
@@ -96,11 +102,11 @@ def zero_crossing_cooling_density(n_lattice,
 
         if (i_mc % n_sweeps_btw_cooling) == 0:
 
-            if i_mc % 10000 == 0:
+            if verbose and (i_mc & 1023) == 0:
                 print(f'cooling #{n_cooling} of {(n_mc_sweeps - n_equil) / n_sweeps_btw_cooling}\n'
                       f'in configuration #{i_mc}')
 
-            x_cold_config = np.copy(x_config)
+            np.copyto(x_cold_config, x_config)
             n_cooling += 1
             n_instantons, n_anti_instantons = 0, 0
 
@@ -152,7 +158,8 @@ def zero_crossing_cooling_density(n_lattice,
                 else:
                     continue
 
-    array_int /= 4 / 3 * np.power(x_potential_minimum, 3)
+    array_int /= 4 / 3 * x_potential_minimum * x_potential_minimum \
+        * x_potential_minimum
     array_int -= 2.
 
     np.savetxt(output_path + '/array_ia.txt', array_ia)